@@ -22,7 +22,7 @@ class ReleaseScriptTests(unittest.TestCase):
         self.assertEqual(release.bump_version("1.2.3", "major"), "2.0.0")
         self.assertEqual(release.bump_version("0.9.0", "major"), "1.0.0")
 
-    def test_update_cargo_toml_version(self):
+    def test_bump_cargo_toml_version(self):
         content = textwrap.dedent(
             """
             [package]
@@ -35,9 +35,11 @@ class ReleaseScriptTests(unittest.TestCase):
             path = os.path.join(tmp, "Cargo.toml")
             with open(path, "w", encoding="utf-8") as handle:
                 handle.write(content)
-            release.update_cargo_toml(path, "1.0.0")
+            current_version, new_version = release.bump_cargo_toml(path, "major")
             with open(path, "r", encoding="utf-8") as handle:
                 updated = handle.read()
+        self.assertEqual(current_version, "0.9.0")
+        self.assertEqual(new_version, "1.0.0")
         self.assertIn('version = "1.0.0"', updated)
 
     def test_update_pkgbuild_version(self):
@@ -52,7 +54,7 @@ class ReleaseScriptTests(unittest.TestCase):
             path = os.path.join(tmp, "PKGBUILD")
             with open(path, "w", encoding="utf-8") as handle:
                 handle.write(content)
-            release.update_pkgbuild(path, "1.0.0")
+            release.update_pkgbuild(path, "0.9.0", "1.0.0")
             with open(path, "r", encoding="utf-8") as handle:
                 updated = handle.read()
         self.assertIn("pkgver=1.0.0", updated)